@@ -1,4 +1,4 @@
-import json
+import orjson
 
 from polar.exceptions import (
     ExtraToken,
@@ -18,9 +18,9 @@ from polar.exceptions import (
 )
 
 
-def get_python_error(err_str, enrich_message=None):
+def get_python_error(err_json, enrich_message=None):
     """Fetch a Polar error and map it into a Python exception."""
-    err = json.loads(err_str)
+    err = orjson.loads(err_json)
 
     message = err["formatted"]
     if enrich_message:
@@ -51,26 +51,29 @@ def get_python_error(err_str, enrich_message=None):
         return _validation_error(message, details)
 
 
+PARSE_ERRORS = {
+    "ExtraToken": ExtraToken,
+    "IntegerOverflow": IntegerOverflow,
+    "InvalidToken": InvalidToken,
+    "InvalidTokenCharacter": InvalidTokenCharacter,
+    "UnrecognizedEOF": UnrecognizedEOF,
+    "UnrecognizedToken": UnrecognizedToken,
+}
+
+RUNTIME_ERRORS = {
+    "Unsupported": UnsupportedError,
+    "TypeError": PolarTypeError,
+    "StackOverflow": StackOverflowError,
+}
+
+
 def _parse_error(subkind, message, details):
     """Map parsing errors."""
-    parse_errors = {
-        "ExtraToken": ExtraToken(message, details),
-        "IntegerOverflow": IntegerOverflow(message, details),
-        "InvalidToken": InvalidToken(message, details),
-        "InvalidTokenCharacter": InvalidTokenCharacter(message, details),
-        "UnrecognizedEOF": UnrecognizedEOF(message, details),
-        "UnrecognizedToken": UnrecognizedToken(message, details),
-    }
-    return parse_errors.get(subkind, ParserError(message, details))
+    return PARSE_ERRORS.get(subkind, ParserError)(message, details)
 
 
 def _runtime_error(subkind, message, details):
-    runtime_errors = {
-        "Unsupported": UnsupportedError(message, details),
-        "TypeError": PolarTypeError(message, details),
-        "StackOverflow": StackOverflowError(message, details),
-    }
-    return runtime_errors.get(subkind, PolarRuntimeError(message, details))
+    return RUNTIME_ERRORS.get(subkind, PolarRuntimeError)(message, details)
 
 
 def _operational_error(subkind, message, details):
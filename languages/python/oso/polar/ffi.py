@@ -1,10 +1,15 @@
-import json
 from dataclasses import dataclass
 from typing import Callable, List, Optional
 
+import orjson
 from _polar_lib import ffi, lib
 
 from .errors import get_python_error
+from .exceptions import OperationalError
+
+# All CResult struct types share the same layout, so they can all be freed
+# through this one (pre-resolved) pointer type.
+C_RESULT_PTR = ffi.typeof("polar_CResult_c_void *")
 
 
 @dataclass(frozen=True)
@@ -21,6 +26,16 @@ def read_c_str(c_str) -> str:
     return python_str
 
 
+def read_c_bytes(c_str) -> bytes:
+    """Copy a C string to Python bytes and free the memory.
+
+    Used for JSON payloads, which orjson decodes straight from bytes, so
+    there is no need to build an intermediate `str`."""
+    python_bytes = ffi.string(c_str)
+    lib.string_free(c_str)
+    return python_bytes
+
+
 class Polar:
     enrich_message: Callable
     """
@@ -47,8 +62,8 @@ class Polar:
         class_tag = to_c_str(class_tag)
         plan = lib.polar_build_filter_plan(self.ptr, typs, prs, var, class_tag)
         process_messages(self.next_message)
-        filter_plan_str = read_c_str(check_result(plan))
-        filter_plan = json.loads(filter_plan_str)
+        filter_plan_json = read_c_bytes(check_result(plan))
+        filter_plan = orjson.loads(filter_plan_json)
         # @TODO(Steve): Decode Filter Plan to not just json?
         return filter_plan
 
@@ -61,8 +76,8 @@ class Polar:
         class_tag = to_c_str(class_tag)
         plan = lib.polar_build_data_filter(self.ptr, typs, prs, var, class_tag)
         process_messages(self.next_message)
-        filter_plan_str = read_c_str(check_result(plan))
-        filter_plan = json.loads(filter_plan_str)
+        filter_plan_json = read_c_bytes(check_result(plan))
+        filter_plan = orjson.loads(filter_plan_json)
         # @TODO(Steve): Decode Filter Plan to not just json?
         return filter_plan
 
@@ -158,10 +173,10 @@ class Query:
         message = to_c_str(message)
         self.check_result(lib.polar_application_error(self.ptr, message))
 
-    def next_event(self) -> str:
+    def next_event(self) -> bytes:
         event = lib.polar_next_query_event(self.ptr)
         self.process_messages()
-        event = read_c_str(self.check_result(event))
+        event = read_c_bytes(self.check_result(event))
         return event
 
     def debug_command(self, command):
@@ -215,13 +230,13 @@ def check_result(result, enrich_message=None):
     # store two pointers: one to a result, one to an error
     # result_free doesn't care about what the pointers actually
     # point to though, so we can use the same result_free method
-    lib.result_free(ffi.cast("polar_CResult_c_void *", result))
+    lib.result_free(ffi.cast(C_RESULT_PTR, result))
     if is_null(e):
         return r
     else:
         assert is_null(r), "internal error: result pointer must be null"
-        error_str = read_c_str(e)
-        error = get_python_error(error_str, enrich_message)
+        error_json = read_c_bytes(e)
+        error = get_python_error(error_json, enrich_message)
         raise error
 
 
@@ -229,12 +244,25 @@ def is_null(result):
     return result == ffi.NULL
 
 
-def to_c_str(string):
-    return ffi.new("char[]", string.encode())
+def to_c_str(string) -> bytes:
+    """Encode a Python string for a `const char *` FFI argument.
+
+    cffi passes a bytes object to a C function as a pointer to its internal,
+    NUL-terminated buffer, so there is no need to copy it into a fresh
+    `char[]` for every call. The core never holds on to these pointers."""
+    return string.encode()
+
 
+def ffi_serialize(value) -> bytes:
+    """Serialize a value to JSON for a `const char *` FFI argument.
 
-def ffi_serialize(value):
-    return to_c_str(json.dumps(value))
+    Non-string dictionary keys are stringified, like `json.dumps` does.
+    Values orjson can't encode (e.g., integers outside the 64-bit range)
+    raise an `OperationalError`, as the core does for unparseable input."""
+    try:
+        return orjson.dumps(value, option=orjson.OPT_NON_STR_KEYS)
+    except orjson.JSONEncodeError as e:
+        raise OperationalError(f"Serialization error: {e}") from e
 
 
 def process_messages(next_message_method):
@@ -242,8 +270,8 @@ def process_messages(next_message_method):
         msg_ptr = check_result(next_message_method())
         if is_null(msg_ptr):
             break
-        msg_str = read_c_str(msg_ptr)
-        message = json.loads(msg_str)
+        msg_json = read_c_bytes(msg_ptr)
+        message = orjson.loads(msg_json)
 
         kind = message["kind"]
         msg = message["msg"]
@@ -2,7 +2,9 @@
 
 import inspect
 import re
+import weakref
 from dataclasses import dataclass
+from functools import lru_cache
 from math import inf, isnan, nan
 from typing import Any, Dict, Union
 
@@ -21,6 +23,27 @@ from .predicate import Predicate
 from .variable import Variable
 
 
+# Terms for immutable scalars are shared between conversions instead of
+# being rebuilt every time. Terms returned by `Host.to_polar` must therefore
+# never be mutated by their callers.
+TRUE_TERM = {"value": {"Boolean": True}}
+FALSE_TERM = {"value": {"Boolean": False}}
+
+# Longer strings are converted without the cache so it can't pin large
+# payloads in memory.
+MAX_CACHED_STRING_LENGTH = 128
+
+
+@lru_cache(maxsize=4096)
+def integer_term(v):
+    return {"value": {"Number": {"Integer": v}}}
+
+
+@lru_cache(maxsize=4096)
+def string_term(v):
+    return {"value": {"String": v}}
+
+
 @dataclass
 class UserType:
     name: str
@@ -41,6 +64,7 @@ class Host:
         instances=None,
         get_field=None,
         adapter=None,
+        mro_indices=None,
     ):
         assert polar, "no Polar handle"
         self.ffi_polar = polar  # a "weak" handle, which we do not free
@@ -49,6 +73,12 @@ class Host:
         self.instances = (instances or {}).copy()
         self._accept_expression = False  # default, see set_accept_expression
         self.adapter = adapter
+        # mro_indices maps a class to the position of each of its bases in its
+        # MRO. It only depends on the classes themselves, so copies share it,
+        # and it holds the classes weakly so it doesn't keep them alive.
+        self.mro_indices = (
+            weakref.WeakKeyDictionary() if mro_indices is None else mro_indices
+        )
 
         self.get_field = get_field or self.types_get_field
 
@@ -82,6 +112,7 @@ class Host:
             instances=self.instances,
             get_field=self.get_field,
             adapter=self.adapter,
+            mro_indices=self.mro_indices,
         )
 
     def get_class(self, name):
@@ -116,18 +147,27 @@ class Host:
         )
         return name
 
-    def register_mros(self) -> None:
-        """Register the MRO of each registered class to be used for rule type validation."""
-        # Get MRO of all registered classes
+    def register_mros(self, cls=None) -> None:
+        """Register the MRO of each registered class to be used for rule type validation.
+
+        If `cls` is given, only the MROs that registering `cls` can change are
+        sent to the core: those of classes that have `cls` in their MRO."""
+        # Get MRO of all (affected) registered classes. Check the MRO itself
+        # rather than calling issubclass, which raises for non-runtime
+        # Protocols.
         for rec in self.distinct_user_types():
-            mro = [self.types[c].id for c in inspect.getmro(rec.cls) if c in self.types]
+            rec_mro = inspect.getmro(rec.cls)
+            if cls is not None and cls not in rec_mro:
+                continue
+            mro = [self.types[c].id for c in rec_mro if c in self.types]
             self.ffi_polar.register_mro(rec.name, mro)
 
     def get_instance(self, id):
         """Look up Python instance by id."""
-        if id not in self.instances:
+        try:
+            return self.instances[id]
+        except KeyError:
             raise UnregisteredInstanceError(id)
-        return self.instances[id]
 
     def cache_instance(self, instance, id=None):
         """Cache Python instance under Polar-generated id."""
@@ -175,13 +215,27 @@ class Host:
     def is_subspecializer(self, instance_id, left_tag, right_tag) -> bool:
         """Return true if the left class is more specific than the right class
         with respect to the given instance."""
+        cls = self.get_instance(instance_id).__class__
+        left = self.get_class(left_tag)
+        right = self.get_class(right_tag)
         try:
-            mro = self.get_instance(instance_id).__class__.__mro__
-            left = self.get_class(left_tag)
-            right = self.get_class(right_tag)
-            return mro.index(left) < mro.index(right)
-        except ValueError:
+            mro_index = self.mro_indices.get(cls)
+        except TypeError:  # not weakly referenceable (or hashable)
+            mro_index = None
+        if mro_index is None:
+            # Leave `cls` (always first) out so the cached value doesn't hold
+            # a strong reference to its own weak key.
+            mro_index = {c: i for i, c in enumerate(cls.__mro__[1:], 1)}
+            try:
+                self.mro_indices[cls] = mro_index
+            except TypeError:
+                pass
+        try:
+            left_index = 0 if left is cls else mro_index[left]
+            right_index = 0 if right is cls else mro_index[right]
+        except KeyError:
             return False
+        return left_index < right_index
 
     def operator(self, op, args):
         try:
@@ -227,91 +281,121 @@ class Host:
 
     def to_polar(self, v):
         """Convert a Python object to a Polar term."""
-        if type(v) == bool:
-            val = {"Boolean": v}
-        elif type(v) == int:
-            val = {"Number": {"Integer": v}}
-        elif type(v) == float:
-            if v == inf:
-                v = "Infinity"
-            elif v == -inf:
-                v = "-Infinity"
-            elif isnan(v):
-                v = "NaN"
-            val = {"Number": {"Float": v}}
-        elif type(v) == str:
-            val = {"String": v}
-        elif type(v) == list:
-            val = {"List": [self.to_polar(i) for i in v]}
-        elif type(v) == dict:
-            val = {
+        convert = self._polar_converters.get(type(v))
+        if convert is not None:
+            return convert(self, v)
+        # Subclasses of the Polar types (e.g., TypeConstraint) convert like
+        # their base class. Everything else is an external instance.
+        for cls in (Predicate, Variable, Expression, Pattern):
+            if isinstance(v, cls):
+                return self._polar_converters[cls](self, v)
+        return self._external_instance_to_polar(v)
+
+    def _bool_to_polar(self, v):
+        return TRUE_TERM if v else FALSE_TERM
+
+    def _int_to_polar(self, v):
+        return integer_term(v)
+
+    def _float_to_polar(self, v):
+        if v == inf:
+            v = "Infinity"
+        elif v == -inf:
+            v = "-Infinity"
+        elif isnan(v):
+            v = "NaN"
+        return {"value": {"Number": {"Float": v}}}
+
+    def _str_to_polar(self, v):
+        if len(v) <= MAX_CACHED_STRING_LENGTH:
+            return string_term(v)
+        return {"value": {"String": v}}
+
+    def _list_to_polar(self, v):
+        return {"value": {"List": [self.to_polar(i) for i in v]}}
+
+    def _dict_to_polar(self, v):
+        return {
+            "value": {
                 "Dictionary": {"fields": {k: self.to_polar(v) for k, v in v.items()}}
             }
-        # only used when you call oso.query() with a Predicate instance
-        elif isinstance(v, Predicate):
-            val = {
+        }
+
+    # only used when you call oso.query() with a Predicate instance
+    def _predicate_to_polar(self, v):
+        return {
+            "value": {
                 "Call": {
                     "name": v.name,
                     "args": [self.to_polar(v) for v in v.args],
                 }
             }
-        # basically only used in data filtering or if someone intentionally manually passes in a Variable instance
-        elif isinstance(v, Variable):
-            val = {"Variable": v}
-        # basically only used in data filtering
-        elif isinstance(v, Expression):
-            val = {
+        }
+
+    # basically only used in data filtering or if someone intentionally manually passes in a Variable instance
+    def _variable_to_polar(self, v):
+        return {"value": {"Variable": v}}
+
+    # basically only used in data filtering
+    def _expression_to_polar(self, v):
+        return {
+            "value": {
                 "Expression": {
                     "operator": v.operator,
                     "args": [self.to_polar(v) for v in v.args],
                 }
             }
-        # basically only used in data filtering (seeding the authorized_query()
-        # call with an initial type binding so we know what type of resources
-        # we're trying to determine access for)
-        elif isinstance(v, Pattern):
-            if v.tag is None:
-                val = {"Pattern": self.to_polar(v.fields)["value"]}
-            else:
-                val = {
-                    "Pattern": {
-                        "Instance": {
-                            "tag": v.tag,
-                            "fields": self.to_polar(v.fields)["value"]["Dictionary"],
-                        }
+        }
+
+    # basically only used in data filtering (seeding the authorized_query()
+    # call with an initial type binding so we know what type of resources
+    # we're trying to determine access for)
+    def _pattern_to_polar(self, v):
+        if v.tag is None:
+            return {"value": {"Pattern": self.to_polar(v.fields)["value"]}}
+        return {
+            "value": {
+                "Pattern": {
+                    "Instance": {
+                        "tag": v.tag,
+                        "fields": self.to_polar(v.fields)["value"]["Dictionary"],
                     }
                 }
-
-        # user queries: oso.allow(<some user instance>, "some action", <some resource instance>)
-        # Host.to_polar translates that into something like
-        #   Call {
-        #       name: String("allow"),
-        #       args: List([
-        #           ExternalInstance { instance_id: 1, repr: "<some user instance>", class_id: <user_class_id> },
-        #           String("some action"),
-        #           ExternalInstance { instance_id: 2, repr: "<some resource instance>", class_id: <resource_class_id> },
-        #       ]
-        #   }
-        else:
-            import inspect
-
-            instance_id = None
-            class_id = None
-
-            # maintain consistent IDs for registered classes
-            if inspect.isclass(v):
-                if v in self.types:
-                    class_id = instance_id = self.types[v].id
-
-            # pass the class_repr only for registered types otherwise None
-            class_repr = self.types[type(v)].name if type(v) in self.types else None
-
-            # pass class_id for classes & instances of registered classes,
-            # otherwise pass None
-            if type(v) in self.types:
-                class_id = self.types[type(v)].id
-
-            val = {
+            }
+        }
+
+    # user queries: oso.allow(<some user instance>, "some action", <some resource instance>)
+    # Host.to_polar translates that into something like
+    #   Call {
+    #       name: String("allow"),
+    #       args: List([
+    #           ExternalInstance { instance_id: 1, repr: "<some user instance>", class_id: <user_class_id> },
+    #           String("some action"),
+    #           ExternalInstance { instance_id: 2, repr: "<some resource instance>", class_id: <resource_class_id> },
+    #       ]
+    #   }
+    def _external_instance_to_polar(self, v):
+        types = self.types
+        instance_id = None
+        class_id = None
+        class_repr = None
+
+        # maintain consistent IDs for registered classes
+        if inspect.isclass(v):
+            rec = types.get(v)
+            if rec is not None:
+                class_id = instance_id = rec.id
+
+        # pass the class_repr only for registered types otherwise None, and
+        # pass class_id for classes & instances of registered classes,
+        # otherwise pass None
+        rec = types.get(type(v))
+        if rec is not None:
+            class_repr = rec.name
+            class_id = rec.id
+
+        return {
+            "value": {
                 "ExternalInstance": {
                     "instance_id": self.cache_instance(v, instance_id),
                     "repr": None,
@@ -319,63 +403,104 @@ class Host:
                     "class_id": class_id,
                 }
             }
-        term = {"value": val}
-        return term
+        }
+
+    # Dispatch table for to_polar, keyed by exact Python type. Holds plain
+    # functions so it is built once, not for every (per-query) Host copy.
+    _polar_converters = {
+        str: _str_to_polar,
+        int: _int_to_polar,
+        bool: _bool_to_polar,
+        float: _float_to_polar,
+        list: _list_to_polar,
+        dict: _dict_to_polar,
+        Predicate: _predicate_to_polar,
+        Variable: _variable_to_polar,
+        Expression: _expression_to_polar,
+        Pattern: _pattern_to_polar,
+    }
 
     def to_python(self, value):
         """Convert a Polar term to a Python object."""
         value = value["value"]
-        tag = [*value][0]
-        if tag in ["String", "Boolean"]:
-            return value[tag]
-        elif tag == "Number":
-            number = [*value[tag].values()][0]
-            if "Float" in value[tag]:
-                if number == "Infinity":
-                    return inf
-                elif number == "-Infinity":
-                    return -inf
-                elif number == "NaN":
-                    return nan
-                else:
-                    if not isinstance(number, float):
-                        raise PolarRuntimeError(
-                            f'Expected a floating point number, got "{number}"'
-                        )
-            return number
-        elif tag == "List":
-            return [self.to_python(e) for e in value[tag]]
-        elif tag == "Dictionary":
-            return {k: self.to_python(v) for k, v in value[tag]["fields"].items()}
-        elif tag == "ExternalInstance":
-            return self.get_instance(value[tag]["instance_id"])
-        elif tag == "Call":
-            return Predicate(
-                name=value[tag]["name"],
-                args=[self.to_python(v) for v in value[tag]["args"]],
-            )
-        elif tag == "Variable":
-            return Variable(value[tag])
-        elif tag == "Expression":
-            if not self._accept_expression:
-                raise UnexpectedPolarTypeError(UNEXPECTED_EXPRESSION_MESSAGE)
-
-            args = list(map(self.to_python, value[tag]["args"]))
-            operator = value[tag]["operator"]
-
-            return Expression(operator, args)
-        elif tag == "Pattern":
-            pattern_tag = [*value[tag]][0]
-            if pattern_tag == "Instance":
-                instance = value[tag]["Instance"]
-                return Pattern(instance["tag"], instance["fields"]["fields"])
-            elif pattern_tag == "Dictionary":
-                dictionary = value[tag]["Dictionary"]
-                return Pattern(None, dictionary["fields"])
+        tag = next(iter(value))
+        try:
+            convert = self._python_converters[tag]
+        except KeyError:
+            raise UnexpectedPolarTypeError(tag)
+        return convert(self, value[tag])
+
+    def _scalar_to_python(self, value):
+        return value
+
+    def _number_to_python(self, value):
+        number = next(iter(value.values()))
+        if "Float" in value:
+            if number == "Infinity":
+                return inf
+            elif number == "-Infinity":
+                return -inf
+            elif number == "NaN":
+                return nan
             else:
-                raise UnexpectedPolarTypeError("Pattern: " + value[tag])
+                if not isinstance(number, float):
+                    raise PolarRuntimeError(
+                        f'Expected a floating point number, got "{number}"'
+                    )
+        return number
 
-        raise UnexpectedPolarTypeError(tag)
+    def _list_to_python(self, value):
+        return [self.to_python(e) for e in value]
+
+    def _dictionary_to_python(self, value):
+        return {k: self.to_python(v) for k, v in value["fields"].items()}
+
+    def _external_instance_to_python(self, value):
+        return self.get_instance(value["instance_id"])
+
+    def _call_to_python(self, value):
+        return Predicate(
+            name=value["name"],
+            args=[self.to_python(v) for v in value["args"]],
+        )
+
+    def _variable_to_python(self, value):
+        return Variable(value)
+
+    def _expression_to_python(self, value):
+        if not self._accept_expression:
+            raise UnexpectedPolarTypeError(UNEXPECTED_EXPRESSION_MESSAGE)
+
+        args = list(map(self.to_python, value["args"]))
+        operator = value["operator"]
+
+        return Expression(operator, args)
+
+    def _pattern_to_python(self, value):
+        pattern_tag = next(iter(value))
+        if pattern_tag == "Instance":
+            instance = value["Instance"]
+            return Pattern(instance["tag"], instance["fields"]["fields"])
+        elif pattern_tag == "Dictionary":
+            dictionary = value["Dictionary"]
+            return Pattern(None, dictionary["fields"])
+        else:
+            raise UnexpectedPolarTypeError(f"Pattern: {value}")
+
+    # Dispatch table for to_python, keyed by Polar term tag. Holds plain
+    # functions so it is built once, not for every (per-query) Host copy.
+    _python_converters = {
+        "String": _scalar_to_python,
+        "Boolean": _scalar_to_python,
+        "Number": _number_to_python,
+        "List": _list_to_python,
+        "Dictionary": _dictionary_to_python,
+        "ExternalInstance": _external_instance_to_python,
+        "Call": _call_to_python,
+        "Variable": _variable_to_python,
+        "Expression": _expression_to_python,
+        "Pattern": _pattern_to_python,
+    }
 
     def set_accept_expression(self, accept):
         """Set whether the Host accepts Expression types from Polar, or raises an error."""
@@ -250,7 +250,7 @@ class Polar:
             fields=fields,
         )
         self.register_constant(cls, name)
-        self.host.register_mros()
+        self.host.register_mros(cls)
 
     def register_constant(self, value, name):
         """
@@ -4,6 +4,8 @@ from typing import Any, Sequence
 class Predicate:
     """Represent a predicate in Polar (`name(args, ...)`)."""
 
+    __slots__ = ("name", "args")
+
     name: str
     args: Sequence[Any]
 
@@ -12,7 +14,7 @@ class Predicate:
         self.args = args
 
     def __str__(self) -> str:
-        return f'{self.name}({", ".join(self.args)})'
+        return f'{self.name}({", ".join(map(str, self.args))})'
 
     def __eq__(self, other: Any) -> bool:
         if not isinstance(other, Predicate):
@@ -1,7 +1,8 @@
-import json
 from collections.abc import Iterable
 from typing import Any, Dict, Generator, List
 
+import orjson
+
 from .data import Condition, DataFilter, Projection
 from .data_filtering import Relation
 from .exceptions import (
@@ -17,6 +18,8 @@ NATIVE_TYPES = [int, float, bool, str, dict, type(None), list]
 class QueryResult:
     """Response type of a call to the `query` API"""
 
+    __slots__ = ("success", "results", "traces")
+
     def __init__(self, results: List[Any]) -> None:
         self.success = len(results) > 0
         self.results = [r["bindings"] for r in results]
@@ -26,6 +29,8 @@ class QueryResult:
 class Query:
     """Execute a Polar query through the FFI/event interface."""
 
+    __slots__ = ("ffi_query", "host", "calls")
+
     def __init__(self, ffi_query, *, host=None, bindings=None):
         self.ffi_query = ffi_query
         self.ffi_query.set_message_enricher(host.enrich_message)
@@ -45,24 +50,23 @@ class Query:
     def run(self) -> Generator[Dict[str, Any], None, None]:
         """Run the event loop and yield results."""
         assert self.ffi_query, "no query to run"
+        call_map = {
+            "MakeExternal": self.handle_make_external,
+            "ExternalCall": self.handle_external_call,
+            "ExternalOp": self.handle_external_op,
+            "ExternalIsa": self.handle_external_isa,
+            "ExternalIsaWithPath": self.handle_external_isa_with_path,
+            "ExternalIsSubSpecializer": self.handle_external_is_subspecializer,
+            "ExternalIsSubclass": self.handle_external_is_subclass,
+            "NextExternal": self.handle_next_external,
+            "Debug": self.handle_debug,
+        }
         while True:
             ffi_event = self.ffi_query.next_event()
-            event = json.loads(ffi_event)
-            kind = [*event][0]
+            event = orjson.loads(ffi_event)
+            kind = next(iter(event))
             data = event[kind]
 
-            call_map = {
-                "MakeExternal": self.handle_make_external,
-                "ExternalCall": self.handle_external_call,
-                "ExternalOp": self.handle_external_op,
-                "ExternalIsa": self.handle_external_isa,
-                "ExternalIsaWithPath": self.handle_external_isa_with_path,
-                "ExternalIsSubSpecializer": self.handle_external_is_subspecializer,
-                "ExternalIsSubclass": self.handle_external_is_subclass,
-                "NextExternal": self.handle_next_external,
-                "Debug": self.handle_debug,
-            }
-
             if kind == "Done":
                 break
             elif kind == "Result":
@@ -74,7 +78,9 @@ class Query:
             elif kind in call_map:
                 call_map[kind](data)
             else:
-                raise PolarRuntimeError(f"Unhandled event: {json.dumps(event)}")
+                raise PolarRuntimeError(
+                    f"Unhandled event: {orjson.dumps(event).decode()}"
+                )
 
     def handle_make_external(self, data):
         instance_id = data["instance_id"]
@@ -192,16 +198,17 @@ class Query:
         call_id = data["call_id"]
         iterable = data["iterable"]
 
-        if call_id not in self.calls:
+        iterator = self.calls.get(call_id)
+        if iterator is None:
             value = self.host.to_python(iterable)
             if isinstance(value, Iterable):
-                self.calls[call_id] = iter(value)
+                iterator = self.calls[call_id] = iter(value)
             else:
                 raise InvalidIteratorError(f"{value} is not iterable")
 
         # Return the next result of the call.
         try:
-            value = next(self.calls[call_id])
+            value = next(iterator)
             self.ffi_query.call_result(call_id, self.host.to_polar(value))
         except StopIteration:
             self.ffi_query.call_result(call_id, None)
@@ -4,6 +4,8 @@ from typing import Any
 class Variable(str):
     """An unbound variable type, can be used to query the KB for information"""
 
+    __slots__ = ()
+
     def __repr__(self) -> str:
         return f"Variable({super().__repr__()})"
 
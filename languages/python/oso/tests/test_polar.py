@@ -3,7 +3,7 @@ from datetime import datetime
 from enum import Enum
 from math import inf, isnan, nan
 from pathlib import Path
-from typing import List
+from typing import List, Protocol
 
 import pytest
 
@@ -38,6 +38,10 @@ def test_data_conversions(polar, qvar):
     assert repr(x) == "Variable('y')"
 
 
+def test_predicate_str():
+    assert str(Predicate("f", [1, "two", Variable("x")])) == "f(1, two, Variable('x'))"
+
+
 def test_load_function(polar, query, qvar):
     """Make sure the load function works."""
     filename = Path(__file__).parent / "test_file.polar"
@@ -93,6 +97,16 @@ def test_clear_rules(polar, query):
     assert len(query("x = new Test()")) == 1
 
 
+def test_external_result_out_of_range(polar, query):
+    class Foo:
+        big = 2**64
+
+    polar.register_class(Foo)
+    with pytest.raises(exceptions.OperationalError) as e:
+        query("x = new Foo().big")
+    assert "Serialization error" in str(e.value)
+
+
 def test_external(polar, qvar, qeval):
     class Bar:
         def y(self):
@@ -988,6 +1002,28 @@ def test_isa_with_path(polar, query):
         query("h(x)")
 
 
+def test_rule_types_with_protocol_class(polar):
+    class Foo:
+        pass
+
+    class Readable(Protocol):
+        def read(self) -> str:
+            ...
+
+    polar.register_class(Foo)
+    polar.register_class(Readable)
+
+    p = """
+    type f(_x: Readable);
+    f(_x: Readable);
+    """
+    polar.load_str(p)
+    polar.clear_rules()
+
+    with pytest.raises(ValidationError):
+        polar.load_str(p + "f(_x: Foo);")
+
+
 def test_rule_types_with_subclass_check(polar):
     class Foo:
         pass